@@ -72,8 +72,8 @@ class CallbackManager(BaseCallbackHandler, ABC):
         if len(handlers) == 0:
             from llama_index.core.settings import Settings
 
-            # hidden var access to prevent recursion in getter
-            cb_manager = Settings._callback_manager
+            # raw dict access to prevent recursion in the lazy getter
+            cb_manager = Settings.__dict__.get("callback_manager")
             if cb_manager is not None:
                 handlers = cb_manager.handlers
 
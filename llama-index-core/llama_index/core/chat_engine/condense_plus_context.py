@@ -20,11 +20,7 @@ from llama_index.core.memory import BaseMemory, ChatMemoryBuffer
 from llama_index.core.postprocessor.types import BaseNodePostprocessor
 from llama_index.core.prompts.base import PromptTemplate
 from llama_index.core.schema import MetadataMode, NodeWithScore
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utilities.token_counting import TokenCounter
 
 logger = logging.getLogger(__name__)
@@ -110,7 +106,7 @@ class CondensePlusContextChatEngine(BaseChatEngine):
         **kwargs: Any,
     ) -> "CondensePlusContextChatEngine":
         """Initialize a CondensePlusContextChatEngine from default parameters."""
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
 
         chat_history = chat_history or []
         memory = memory or ChatMemoryBuffer.from_defaults(
@@ -124,9 +120,7 @@ class CondensePlusContextChatEngine(BaseChatEngine):
             context_prompt=context_prompt,
             condense_prompt=condense_prompt,
             skip_condense=skip_condense,
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            ),
+            callback_manager=(service_context or Settings).callback_manager,
             node_postprocessors=node_postprocessors,
             system_prompt=system_prompt,
             verbose=verbose,
@@ -26,11 +26,7 @@ from llama_index.core.memory import BaseMemory, ChatMemoryBuffer
 from llama_index.core.prompts.base import BasePromptTemplate, PromptTemplate
 from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import LLMPredictorType
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.tools import ToolOutput
 
 logger = logging.getLogger(__name__)
@@ -95,7 +91,7 @@ class CondenseQuestionChatEngine(BaseChatEngine):
         """Initialize a CondenseQuestionChatEngine from default parameters."""
         condense_question_prompt = condense_question_prompt or DEFAULT_PROMPT
 
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
 
         chat_history = chat_history or []
         memory = memory or memory_cls.from_defaults(chat_history=chat_history, llm=llm)
@@ -115,9 +111,7 @@ class CondenseQuestionChatEngine(BaseChatEngine):
             memory,
             llm,
             verbose=verbose,
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            ),
+            callback_manager=(service_context or Settings).callback_manager,
         )
 
     def _condense_question(
@@ -12,13 +12,7 @@ from llama_index.core.llms.llm import LLM
 from llama_index.core.query_engine.router_query_engine import RouterQueryEngine
 from llama_index.core.schema import Document, TransformComponent
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-    transformations_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.tools.query_engine import QueryEngineTool
 
@@ -60,17 +54,15 @@ class QASummaryQueryEngineBuilder:
         service_context: Optional[ServiceContext] = None,
     ) -> None:
         """Init params."""
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
-        )
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, service_context
+            or (service_context or Settings).callback_manager
         )
+        self._embed_model = embed_model or (service_context or Settings).embed_model
         self._transformations = (
             transformations
-            or transformations_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).transformations
         )
 
         self._storage_context = storage_context or StorageContext.from_defaults()
@@ -12,7 +12,7 @@ from llama_index.core.llms.llm import LLM
 from llama_index.core.prompts import BasePromptTemplate, PromptTemplate
 from llama_index.core.prompts.mixin import PromptDictType
 from llama_index.core.schema import Document
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 
 DEFAULT_EVAL_TEMPLATE = PromptTemplate(
     "Your task is to evaluate if the retrieved context from the document sources are relevant to the query.\n"
@@ -95,7 +95,7 @@ class ContextRelevancyEvaluator(BaseEvaluator):
         service_context: Optional[ServiceContext] = None,
     ) -> None:
         """Init params."""
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._raise_error = raise_error
 
         self._eval_template: BasePromptTemplate
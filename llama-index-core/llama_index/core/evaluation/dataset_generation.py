@@ -28,12 +28,7 @@ from llama_index.core.schema import (
     NodeWithScore,
     TransformComponent,
 )
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-    transformations_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 
 DEFAULT_QUESTION_GENERATION_PROMPT = """\
 Context information is below.
@@ -146,10 +141,10 @@ class DatasetGenerator(PromptMixin):
         service_context: ServiceContext | None = None,
     ) -> None:
         """Init params."""
-        self.llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self.llm = llm or (service_context or Settings).llm
         self.callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
         self.text_question_template = text_question_template or PromptTemplate(
             DEFAULT_QUESTION_GENERATION_PROMPT
@@ -185,13 +180,13 @@ class DatasetGenerator(PromptMixin):
         service_context: ServiceContext | None = None,
     ) -> DatasetGenerator:
         """Generate dataset from documents."""
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
-        transformations = transformations or transformations_from_settings_or_context(
-            Settings, service_context
+        llm = llm or (service_context or Settings).llm
+        transformations = (
+            transformations or (service_context or Settings).transformations
         )
         callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
         nodes = run_transformations(
@@ -18,7 +18,7 @@ from llama_index.core.prompts import (
     PromptTemplate,
 )
 from llama_index.core.prompts.mixin import PromptDictType
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 
 DEFAULT_SYSTEM_TEMPLATE = (
     "Please act as an impartial judge and evaluate the quality of the responses provided by two "
@@ -119,7 +119,7 @@ class PairwiseComparisonEvaluator(BaseEvaluator):
         # deprecated
         service_context: Optional[ServiceContext] = None,
     ) -> None:
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         self._eval_template: BasePromptTemplate
         if isinstance(eval_template, str):
@@ -8,7 +8,7 @@ from llama_index.core.base.embeddings.base import (
 from llama_index.core.evaluation.base import BaseEvaluator, EvaluationResult
 from llama_index.core.prompts.mixin import PromptDictType
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, embed_model_from_settings_or_context
+from llama_index.core.settings import Settings
 
 
 class SemanticSimilarityEvaluator(BaseEvaluator):
@@ -37,9 +37,7 @@ class SemanticSimilarityEvaluator(BaseEvaluator):
         # deprecated
         service_context: Optional[ServiceContext] = None,
     ) -> None:
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, service_context
-        )
+        self._embed_model = embed_model or (service_context or Settings).embed_model
         if similarity_fn is None:
             similarity_mode = similarity_mode or SimilarityMode.DEFAULT
             self._similarity_fn = lambda x, y: similarity(x, y, mode=similarity_mode)
@@ -13,12 +13,7 @@ from llama_index.core.ingestion import run_transformations
 from llama_index.core.llms.utils import LLMType, resolve_llm
 from llama_index.core.schema import BaseNode, Document, IndexNode, TransformComponent
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-    transformations_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import BaseDocumentStore, RefDocInfo
 from llama_index.core.storage.storage_context import StorageContext
 
@@ -80,7 +75,7 @@ class BaseIndex(Generic[IS], ABC):
         self._graph_store = self._storage_context.graph_store
         self._callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
         objects = objects or []
@@ -99,7 +94,7 @@ class BaseIndex(Generic[IS], ABC):
 
         self._transformations = (
             transformations
-            or transformations_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).transformations
         )
 
     @classmethod
@@ -125,10 +120,10 @@ class BaseIndex(Generic[IS], ABC):
         docstore = storage_context.docstore
         callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
-        transformations = transformations or transformations_from_settings_or_context(
-            Settings, service_context
+        transformations = (
+            transformations or (service_context or Settings).transformations
         )
 
         with callback_manager.as_trace("index_construction"):
@@ -401,7 +396,7 @@ class BaseIndex(Generic[IS], ABC):
         llm = (
             resolve_llm(llm, callback_manager=self._callback_manager)
             if llm
-            else llm_from_settings_or_context(Settings, self.service_context)
+            else (self.service_context or Settings).llm
         )
 
         return RetrieverQueryEngine.from_args(
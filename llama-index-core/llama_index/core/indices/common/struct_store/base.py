@@ -23,11 +23,7 @@ from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import (
     LLMPredictorType,
 )
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utilities.sql_wrapper import SQLDatabase
 from llama_index.core.utils import truncate_text
 
@@ -66,13 +62,13 @@ class SQLDocumentContextBuilder:
             raise ValueError("sql_database must be provided.")
         self._sql_database = sql_database
         self._text_splitter = text_splitter
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
-        self._prompt_helper = Settings._prompt_helper or PromptHelper.from_llm_metadata(
+        self._llm = llm or (service_context or Settings).llm
+        self._prompt_helper = Settings.__dict__.get(
+            "prompt_helper"
+        ) or PromptHelper.from_llm_metadata(
             self._llm.metadata,
         )
-        self._callback_manager = callback_manager_from_settings_or_context(
-            Settings, service_context
-        )
+        self._callback_manager = (service_context or Settings).callback_manager
         self._table_context_prompt = (
             table_context_prompt or DEFAULT_TABLE_CONTEXT_PROMPT
         )
@@ -13,11 +13,7 @@ from llama_index.core.llms.llm import LLM
 from llama_index.core.prompts import BasePromptTemplate
 from llama_index.core.schema import BaseNode, MetadataMode, TextNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore import BaseDocumentStore
 from llama_index.core.storage.docstore.registry import get_default_docstore
 from llama_index.core.utils import get_tqdm_iterable
@@ -48,13 +44,13 @@ class GPTTreeIndexBuilder:
             raise ValueError("Invalid number of children.")
         self.num_children = num_children
         self.summary_prompt = summary_prompt
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
-        self._prompt_helper = Settings._prompt_helper or PromptHelper.from_llm_metadata(
+        self._llm = llm or (service_context or Settings).llm
+        self._prompt_helper = Settings.__dict__.get(
+            "prompt_helper"
+        ) or PromptHelper.from_llm_metadata(
             self._llm.metadata,
         )
-        self._callback_manager = callback_manager_from_settings_or_context(
-            Settings, service_context
-        )
+        self._callback_manager = (service_context or Settings).callback_manager
         self._use_async = use_async
         self._show_progress = show_progress
         self._docstore = docstore or get_default_docstore()
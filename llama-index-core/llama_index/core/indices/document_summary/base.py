@@ -32,11 +32,7 @@ from llama_index.core.schema import (
     TextNode,
 )
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import RefDocInfo
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.utils import get_tqdm_iterable
@@ -93,10 +89,8 @@ class DocumentSummaryIndex(BaseIndex[IndexDocumentSummary]):
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, service_context
-        )
+        self._llm = llm or (service_context or Settings).llm
+        self._embed_model = embed_model or (service_context or Settings).embed_model
 
         self._response_synthesizer = response_synthesizer or get_response_synthesizer(
             llm=self._llm, response_mode=ResponseMode.TREE_SUMMARIZE
@@ -27,7 +27,7 @@ from llama_index.core.prompts.default_prompts import (
 )
 from llama_index.core.schema import BaseNode, IndexNode, MetadataMode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import RefDocInfo
 from llama_index.core.utils import get_tqdm_iterable
 
@@ -78,7 +78,7 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
     ) -> None:
         """Initialize params."""
         # need to set parameters before building index in base class.
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         self.max_keywords_per_chunk = max_keywords_per_chunk
         self.keyword_extract_template = (
@@ -21,11 +21,7 @@ from llama_index.core.prompts.default_prompts import (
 )
 from llama_index.core.schema import BaseNode, IndexNode, MetadataMode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import RefDocInfo
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.utils import get_tqdm_iterable
@@ -91,10 +87,8 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
         self._max_object_length = max_object_length
         self._kg_triplet_extract_fn = kg_triplet_extract_fn
 
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, service_context
-        )
+        self._llm = llm or (service_context or Settings).llm
+        self._embed_model = embed_model or (service_context or Settings).embed_model
 
         super().__init__(
             nodes=nodes,
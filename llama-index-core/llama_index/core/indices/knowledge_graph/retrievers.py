@@ -26,12 +26,7 @@ from llama_index.core.schema import (
     TextNode,
 )
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.utils import print_text, truncate_text
 
@@ -127,9 +122,9 @@ class KGTableRetriever(BaseRetriever):
             else KGRetrieverMode.KEYWORD
         )
 
-        self._llm = llm or llm_from_settings_or_context(Settings, index.service_context)
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, index.service_context
+        self._llm = llm or (index.service_context or Settings).llm
+        self._embed_model = (
+            embed_model or (index.service_context or Settings).embed_model
         )
 
         self._graph_store = index.graph_store
@@ -147,9 +142,7 @@ class KGTableRetriever(BaseRetriever):
             self._graph_schema = ""
         super().__init__(
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(
-                Settings, index.service_context
-            ),
+            or (index.service_context or Settings).callback_manager,
             object_map=object_map,
             verbose=verbose,
         )
@@ -475,7 +468,7 @@ class KnowledgeGraphRAGRetriever(BaseRetriever):
         self._storage_context = storage_context
         self._graph_store = storage_context.graph_store
 
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         self._entity_extract_fn = entity_extract_fn
         self._entity_extract_template = (
@@ -540,7 +533,7 @@ class KnowledgeGraphRAGRetriever(BaseRetriever):
 
         super().__init__(
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
     def _process_entities(
@@ -23,11 +23,7 @@ from llama_index.core.schema import (
     QueryBundle,
 )
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -89,8 +85,8 @@ class SummaryIndexEmbeddingRetriever(BaseRetriever):
     ) -> None:
         self._index = index
         self._similarity_top_k = similarity_top_k
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, index.service_context
+        self._embed_model = (
+            embed_model or (index.service_context or Settings).embed_model
         )
         super().__init__(
             callback_manager=callback_manager, object_map=object_map, verbose=verbose
@@ -187,7 +183,7 @@ class SummaryIndexLLMRetriever(BaseRetriever):
         self._parse_choice_select_answer_fn = (
             parse_choice_select_answer_fn or default_parse_choice_select_answer_fn
         )
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         super().__init__(
             callback_manager=callback_manager, object_map=object_map, verbose=verbose
         )
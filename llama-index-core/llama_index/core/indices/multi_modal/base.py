@@ -27,7 +27,7 @@ from llama_index.core.llms.utils import LLMType
 from llama_index.core.multi_modal_llms import MultiModalLLM
 from llama_index.core.schema import BaseNode, ImageNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.vector_stores.simple import (
     DEFAULT_VECTOR_STORE,
@@ -152,7 +152,7 @@ class MultiModalVectorStoreIndex(VectorStoreIndex):
 
         retriever = cast(MultiModalVectorIndexRetriever, self.as_retriever(**kwargs))
 
-        llm = llm or llm_from_settings_or_context(Settings, self._service_context)
+        llm = llm or (self._service_context or Settings).llm
         assert isinstance(llm, MultiModalLLM)
 
         return SimpleMultiModalQueryEngine(
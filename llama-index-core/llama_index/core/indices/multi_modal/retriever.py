@@ -19,10 +19,7 @@ from llama_index.core.schema import (
     QueryBundle,
     QueryType,
 )
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.vector_stores.types import (
     MetadataFilters,
     BasePydanticVectorStore,
@@ -88,9 +85,7 @@ class MultiModalVectorIndexRetriever(MultiModalRetriever):
         self._kwargs: Dict[str, Any] = kwargs.get("vector_store_kwargs", {})
         self.callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(
-                Settings, self._service_context
-            )
+            or (self._service_context or Settings).callback_manager
         )
 
     @property
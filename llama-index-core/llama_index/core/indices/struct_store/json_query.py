@@ -12,11 +12,7 @@ from llama_index.core.prompts.mixin import PromptDictType, PromptMixinType
 from llama_index.core.prompts.prompt_type import PromptType
 from llama_index.core.schema import QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utils import print_text
 
 logger = logging.getLogger(__name__)
@@ -126,7 +122,7 @@ class JSONQueryEngine(BaseQueryEngine):
         """Initialize params."""
         self._json_value = json_value
         self._json_schema = json_schema
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._json_path_prompt = json_path_prompt or DEFAULT_JSON_PATH_PROMPT
         self._output_processor = output_processor or default_output_processor
         self._output_kwargs = output_kwargs or {}
@@ -137,9 +133,7 @@ class JSONQueryEngine(BaseQueryEngine):
         )
 
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            )
+            callback_manager=(service_context or Settings).callback_manager
         )
 
     def _get_prompts(self) -> Dict[str, Any]:
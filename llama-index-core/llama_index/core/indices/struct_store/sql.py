@@ -17,7 +17,7 @@ from llama_index.core.indices.struct_store.container_builder import (
 from llama_index.core.llms.utils import LLMType
 from llama_index.core.schema import BaseNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.utilities.sql_wrapper import SQLDatabase
 from sqlalchemy import Table
 
@@ -111,7 +111,7 @@ class SQLStructStoreIndex(BaseStructStoreIndex[SQLStructTable]):
             return index_struct
         else:
             data_extractor = SQLStructDatapointExtractor(
-                llm_from_settings_or_context(Settings, self.service_context),
+                (self.service_context or Settings).llm,
                 self.schema_extract_prompt,
                 self.output_parser,
                 self.sql_database,
@@ -131,7 +131,7 @@ class SQLStructStoreIndex(BaseStructStoreIndex[SQLStructTable]):
     def _insert(self, nodes: Sequence[BaseNode], **insert_kwargs: Any) -> None:
         """Insert a document."""
         data_extractor = SQLStructDatapointExtractor(
-            llm_from_settings_or_context(Settings, self._service_context),
+            (self._service_context or Settings).llm,
             self.schema_extract_prompt,
             self.output_parser,
             self.sql_database,
@@ -31,11 +31,7 @@ from llama_index.core.response_synthesizers import (
 )
 from llama_index.core.schema import QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utilities.sql_wrapper import SQLDatabase
 from sqlalchemy import Table
 
@@ -99,9 +95,7 @@ class SQLStructStoreQueryEngine(BaseQueryEngine):
         )
         self._sql_only = sql_only
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, index.service_context
-            )
+            callback_manager=(index.service_context or Settings).callback_manager
         )
 
     def _get_prompt_modules(self) -> PromptMixinType:
@@ -177,7 +171,7 @@ class NLStructStoreQueryEngine(BaseQueryEngine):
     ) -> None:
         """Initialize params."""
         self._index = index
-        self._llm = llm_from_settings_or_context(Settings, index.service_context)
+        self._llm = (index.service_context or Settings).llm
         self._sql_database = index.sql_database
         self._sql_context_container = index.sql_context_container
         self._service_context = index.service_context
@@ -191,9 +185,7 @@ class NLStructStoreQueryEngine(BaseQueryEngine):
         self._synthesize_response = synthesize_response
         self._sql_only = sql_only
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, index.service_context
-            )
+            callback_manager=(index.service_context or Settings).callback_manager
         )
 
     @property
@@ -335,7 +327,7 @@ class BaseSQLTableQueryEngine(BaseQueryEngine):
     ) -> None:
         """Initialize params."""
         self._service_context = service_context
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         if callback_manager is not None:
             self._llm.callback_manager = callback_manager
 
@@ -355,7 +347,7 @@ class BaseSQLTableQueryEngine(BaseQueryEngine):
         self._streaming = streaming
         super().__init__(
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context),
+            or (service_context or Settings).callback_manager,
         )
 
     def _get_prompts(self) -> Dict[str, Any]:
@@ -19,11 +19,7 @@ from llama_index.core.prompts.default_prompts import (
 )
 from llama_index.core.schema import BaseNode, IndexNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    embed_model_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import RefDocInfo
 
 
@@ -88,7 +84,7 @@ class TreeIndex(BaseIndex[IndexGraph]):
         self.insert_prompt: BasePromptTemplate = insert_prompt or DEFAULT_INSERT_PROMPT
         self.build_tree = build_tree
         self._use_async = use_async
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         super().__init__(
             nodes=nodes,
             index_struct=index_struct,
@@ -123,9 +119,7 @@ class TreeIndex(BaseIndex[IndexGraph]):
         if retriever_mode == TreeRetrieverMode.SELECT_LEAF:
             return TreeSelectLeafRetriever(self, object_map=self._object_map, **kwargs)
         elif retriever_mode == TreeRetrieverMode.SELECT_LEAF_EMBEDDING:
-            embed_model = embed_model or embed_model_from_settings_or_context(
-                Settings, self._service_context
-            )
+            embed_model = embed_model or (self._service_context or Settings).embed_model
             return TreeSelectLeafEmbeddingRetriever(
                 self, embed_model=embed_model, object_map=self._object_map, **kwargs
             )
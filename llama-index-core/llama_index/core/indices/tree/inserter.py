@@ -17,10 +17,7 @@ from llama_index.core.prompts.default_prompts import (
 )
 from llama_index.core.schema import BaseNode, MetadataMode, TextNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore import BaseDocumentStore
 from llama_index.core.storage.docstore.registry import get_default_docstore
 
@@ -45,8 +42,10 @@ class TreeIndexInserter:
         self.summary_prompt = summary_prompt
         self.insert_prompt = insert_prompt
         self.index_graph = index_graph
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
-        self._prompt_helper = Settings._prompt_helper or PromptHelper.from_llm_metadata(
+        self._llm = llm or (service_context or Settings).llm
+        self._prompt_helper = Settings.__dict__.get(
+            "prompt_helper"
+        ) or PromptHelper.from_llm_metadata(
             self._llm.metadata,
         )
         self._docstore = docstore or get_default_docstore()
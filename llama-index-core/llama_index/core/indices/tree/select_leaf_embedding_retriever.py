@@ -12,7 +12,7 @@ from llama_index.core.indices.tree.select_leaf_retriever import (
 from llama_index.core.indices.utils import get_sorted_node_list
 from llama_index.core.prompts import BasePromptTemplate
 from llama_index.core.schema import BaseNode, MetadataMode, QueryBundle
-from llama_index.core.settings import Settings, embed_model_from_settings_or_context
+from llama_index.core.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -68,8 +68,8 @@ class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
             object_map=object_map,
             **kwargs,
         )
-        self._embed_model = embed_model or embed_model_from_settings_or_context(
-            Settings, index.service_context
+        self._embed_model = (
+            embed_model or (index.service_context or Settings).embed_model
         )
 
     def _query_level(
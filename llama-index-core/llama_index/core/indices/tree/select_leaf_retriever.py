@@ -30,10 +30,7 @@ from llama_index.core.schema import (
     NodeWithScore,
     QueryBundle,
 )
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utils import print_text, truncate_text
 
 logger = logging.getLogger(__name__)
@@ -93,7 +90,9 @@ class TreeSelectLeafRetriever(BaseRetriever):
         self._index_struct = index.index_struct
         self._docstore = index.docstore
         self._service_context = index.service_context
-        self._prompt_helper = Settings._prompt_helper or PromptHelper.from_llm_metadata(
+        self._prompt_helper = Settings.__dict__.get(
+            "prompt_helper"
+        ) or PromptHelper.from_llm_metadata(
             self._llm.metadata,
         )
 
@@ -106,9 +105,7 @@ class TreeSelectLeafRetriever(BaseRetriever):
         self.child_branch_factor = child_branch_factor
         super().__init__(
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(
-                Settings, index.service_context
-            ),
+            or (index.service_context or Settings).callback_manager,
             object_map=object_map,
             verbose=verbose,
         )
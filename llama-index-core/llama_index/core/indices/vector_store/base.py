@@ -22,7 +22,7 @@ from llama_index.core.schema import (
     TransformComponent,
 )
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, embed_model_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.storage.docstore.types import RefDocInfo
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.utils import iter_batch
@@ -68,7 +68,7 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         self._embed_model = (
             resolve_embed_model(embed_model, callback_manager=callback_manager)
             if embed_model
-            else embed_model_from_settings_or_context(Settings, service_context)
+            else (service_context or Settings).embed_model
         )
 
         self._insert_batch_size = insert_batch_size
@@ -23,11 +23,7 @@ from llama_index.core.prompts.base import PromptTemplate
 from llama_index.core.prompts.mixin import PromptDictType
 from llama_index.core.schema import IndexNode, QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.vector_stores.types import (
     FilterCondition,
     MetadataFilters,
@@ -98,10 +94,10 @@ class VectorIndexAutoRetriever(BaseAutoRetriever):
         self._default_empty_query_vector = default_empty_query_vector
 
         service_context = service_context or self._index.service_context
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
         # prompt
@@ -33,9 +33,6 @@ from llama_index.core.ingestion.cache import DEFAULT_CACHE_NAME, IngestionCache
 from llama_index.core.ingestion.data_sources import (
     ConfigurableDataSources,
 )
-from llama_index.core.ingestion.transformations import (
-    ConfigurableTransformations,
-)
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core.readers.base import ReaderConfig
 from llama_index.core.schema import (
@@ -58,6 +55,11 @@ from llama_index.core.vector_stores.types import BasePydanticVectorStore
 def deserialize_transformation_component(
     component_dict: dict, component_type: ConfigurableTransformationNames
 ) -> BaseComponent:
+    # imported lazily: resolving the enum imports every supported component
+    from llama_index.core.ingestion.transformations import (
+        ConfigurableTransformations,
+    )
+
     component_cls = ConfigurableTransformations[component_type].value.component_type
     return component_cls.from_dict(component_dict)
 
@@ -3,7 +3,7 @@ This module maintains the list of transformations that are supported by the syst
 """
 
 from enum import Enum
-from typing import Generic, Sequence, Type, TypeVar
+from typing import Any, Generic, Sequence, Type, TypeVar
 
 from llama_index.core.bridge.pydantic import (
     BaseModel,
@@ -11,16 +11,6 @@ from llama_index.core.bridge.pydantic import (
     GenericModel,
     ValidationError,
 )
-from llama_index.core.node_parser import (
-    CodeSplitter,
-    HTMLNodeParser,
-    JSONNodeParser,
-    MarkdownNodeParser,
-    SentenceSplitter,
-    SimpleFileNodeParser,
-    TokenTextSplitter,
-    MarkdownElementNodeParser,
-)
 from llama_index.core.schema import BaseComponent, BaseNode, Document
 
 
@@ -95,19 +85,31 @@ def build_configurable_transformation_enum():
     Build an enum of configurable transformations.
     But conditional on if the corresponding component is available.
     """
+    # imported here (with the optional embedding integrations below) so that
+    # importing this module stays cheap; the enum is only built on first use
+    from llama_index.core.node_parser import (
+        CodeSplitter,
+        HTMLNodeParser,
+        JSONNodeParser,
+        MarkdownElementNodeParser,
+        MarkdownNodeParser,
+        SentenceSplitter,
+        SimpleFileNodeParser,
+        TokenTextSplitter,
+    )
 
     class ConfigurableComponent(Enum):
         @classmethod
         def from_component(
             cls, component: BaseComponent
         ) -> "ConfigurableTransformations":
-            component_class = type(component)
-            for component_type in cls:
-                if component_type.value.component_type == component_class:
-                    return component_type
-            raise ValueError(
-                f"Component {component} is not a supported transformation component."
-            )
+            component_type = cls._component_type_lookup.get(type(component))
+            if component_type is None:
+                raise ValueError(
+                    f"Component {component} is not a supported transformation "
+                    "component."
+                )
+            return component_type
 
         def build_configured_transformation(
             self, component: BaseComponent
@@ -118,9 +120,7 @@ def build_configurable_transformation_enum():
                     f"The enum value {self} is not compatible with component of "
                     f"type {type(component)}"
                 )
-            return ConfiguredTransformation[component_type](  # type: ignore
-                component=component, name=self.value.name
-            )
+            return self._configured_model(component=component, name=self.value.name)
 
     enum_members = []
 
@@ -266,10 +266,45 @@ def build_configurable_transformation_enum():
     except (ImportError, ValidationError):
         pass
 
-    return ConfigurableComponent("ConfigurableTransformations", enum_members)
-
+    configurable_transformations = ConfigurableComponent(
+        "ConfigurableTransformations", enum_members
+    )
+    # component class -> enum member registry, so from_component is a dict
+    # lookup instead of a scan over every member
+    configurable_transformations._component_type_lookup = {
+        member.value.component_type: member for member in configurable_transformations
+    }
+    # parametrize ConfiguredTransformation[...] once per member; subscripting
+    # the generic model per call re-runs the typing/pydantic generics machinery
+    for member in configurable_transformations:
+        member._configured_model = ConfiguredTransformation[  # type: ignore
+            member.value.component_type
+        ]
+    return configurable_transformations
+
+
+# Built lazily on first access (see __getattr__ below): assembling the enum
+# imports the node parsers and probes the optional embedding integrations,
+# which is too heavy to pay on every `import llama_index.core.ingestion`.
+_configurable_transformations = None
+
+
+def _get_configurable_transformations():
+    global _configurable_transformations
+    if _configurable_transformations is None:
+        _configurable_transformations = build_configurable_transformation_enum()
+    return _configurable_transformations
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: resolve ConfigurableTransformations on first attribute access
+    # and cache it in the module globals for subsequent lookups.
+    if name == "ConfigurableTransformations":
+        value = _get_configurable_transformations()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-ConfigurableTransformations = build_configurable_transformation_enum()
 
 T = TypeVar("T", bound=BaseComponent)
 
@@ -297,10 +332,12 @@ class ConfiguredTransformation(GenericModel, Generic[T]):
         ConfiguredTransformation[SentenceSplitter] if simple_node_parser is
         a SentenceSplitter.
         """
-        return ConfigurableTransformations.from_component(
-            component
-        ).build_configured_transformation(component)
+        return (
+            _get_configurable_transformations()
+            .from_component(component)
+            .build_configured_transformation(component)
+        )
 
     @property
-    def configurable_transformation_type(self) -> ConfigurableTransformations:
-        return ConfigurableTransformations.from_component(self.component)
+    def configurable_transformation_type(self) -> "ConfigurableTransformations":
+        return _get_configurable_transformations().from_component(self.component)
@@ -30,11 +30,7 @@ from llama_index.core.schema import (
     NodeWithScore,
     TransformComponent,
 )
-from llama_index.core.settings import (
-    Settings,
-    llm_from_settings_or_context,
-    transformations_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 
 DEFAULT_QUESTION_GENERATION_PROMPT = """\
 Context information is below.
@@ -78,7 +74,7 @@ class RagDatasetGenerator(PromptMixin):
         service_context: Optional[ServiceContext] = None,
     ) -> None:
         """Init params."""
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self.num_questions_per_chunk = num_questions_per_chunk
         self.text_question_template = text_question_template or PromptTemplate(
             DEFAULT_QUESTION_GENERATION_PROMPT
@@ -111,9 +107,9 @@ class RagDatasetGenerator(PromptMixin):
         service_context: Optional[ServiceContext] = None,
     ) -> RagDatasetGenerator:
         """Generate dataset from documents."""
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
-        transformations = transformations or transformations_from_settings_or_context(
-            Settings, service_context
+        llm = llm or (service_context or Settings).llm
+        transformations = (
+            transformations or (service_context or Settings).transformations
         )
 
         nodes = run_transformations(
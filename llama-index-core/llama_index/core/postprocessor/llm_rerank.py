@@ -13,7 +13,7 @@ from llama_index.core.prompts.default_prompts import DEFAULT_CHOICE_SELECT_PROMP
 from llama_index.core.prompts.mixin import PromptDictType
 from llama_index.core.schema import NodeWithScore, QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 
 
 class LLMRerank(BaseNodePostprocessor):
@@ -41,7 +41,7 @@ class LLMRerank(BaseNodePostprocessor):
     ) -> None:
         choice_select_prompt = choice_select_prompt or DEFAULT_CHOICE_SELECT_PROMPT
 
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
 
         self._format_node_batch_fn = (
             format_node_batch_fn or default_format_node_batch_fn
@@ -23,11 +23,7 @@ from llama_index.core.schema import (
     QueryBundle,
     TextNode,
 )
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 
 CITATION_QA_TEMPLATE = PromptTemplate(
     "Please provide an answer based solely on the provided sources. "
@@ -123,9 +119,9 @@ class CitationQueryEngine(BaseQueryEngine):
         service_context = retriever.get_service_context()
         callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
 
         self._response_synthesizer = response_synthesizer or get_response_synthesizer(
             llm=llm,
@@ -204,9 +200,7 @@ class CitationQueryEngine(BaseQueryEngine):
             retriever=retriever,
             llm=llm,
             response_synthesizer=response_synthesizer,
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, index.service_context
-            ),
+            callback_manager=(index.service_context or Settings).callback_manager,
             citation_chunk_size=citation_chunk_size,
             citation_chunk_overlap=citation_chunk_overlap,
             text_splitter=text_splitter,
@@ -24,7 +24,7 @@ from llama_index.core.query_engine.flare.output_parser import (
 from llama_index.core.query_engine.retriever_query_engine import RetrieverQueryEngine
 from llama_index.core.schema import QueryBundle, NodeWithScore
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.utils import print_text
 
 # These prompts are taken from the FLARE repo:
@@ -140,7 +140,7 @@ class FLAREInstructQueryEngine(BaseQueryEngine):
         """Init params."""
         super().__init__(callback_manager=callback_manager)
         self._query_engine = query_engine
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._instruct_prompt = instruct_prompt or DEFAULT_INSTRUCT_PROMPT
         self._lookahead_answer_inserter = lookahead_answer_inserter or (
             LLMLookaheadAnswerInserter(llm=self._llm)
@@ -5,10 +5,7 @@ from llama_index.core.base.response.schema import RESPONSE_TYPE
 from llama_index.core.callbacks.schema import CBEventType, EventPayload
 from llama_index.core.indices.composability.graph import ComposableGraph
 from llama_index.core.schema import IndexNode, NodeWithScore, QueryBundle, TextNode
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 import llama_index.core.instrumentation as instrument
 
 dispatcher = instrument.get_dispatcher(__name__)
@@ -44,9 +41,7 @@ class ComposableGraphQueryEngine(BaseQueryEngine):
 
         # additional configs
         self._recursive = recursive
-        callback_manager = callback_manager_from_settings_or_context(
-            Settings, self._graph.service_context
-        )
+        callback_manager = (self._graph.service_context or Settings).callback_manager
         super().__init__(callback_manager=callback_manager)
 
     def _get_prompt_modules(self) -> Dict[str, Any]:
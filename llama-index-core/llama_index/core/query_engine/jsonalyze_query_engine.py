@@ -16,11 +16,7 @@ from llama_index.core.prompts.mixin import PromptDictType, PromptMixinType
 from llama_index.core.prompts.prompt_type import PromptType
 from llama_index.core.schema import QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.utils import print_text
 
 logger = logging.getLogger(__name__)
@@ -242,7 +238,7 @@ class JSONalyzeQueryEngine(BaseQueryEngine):
     ) -> None:
         """Initialize params."""
         self._list_of_dict = list_of_dict
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._jsonalyze_prompt = jsonalyze_prompt or DEFAULT_JSONALYZE_PROMPT
         self._use_async = use_async
         self._analyzer = load_jsonalyzer(use_async, analyzer)
@@ -255,9 +251,7 @@ class JSONalyzeQueryEngine(BaseQueryEngine):
         self._verbose = verbose
 
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            )
+            callback_manager=(service_context or Settings).callback_manager
         )
 
     def _get_prompts(self) -> Dict[str, Any]:
@@ -19,11 +19,7 @@ from llama_index.core.response_synthesizers import (
 )
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.storage.storage_context import StorageContext
 from llama_index.core.utils import print_text
 
@@ -84,7 +80,7 @@ class KnowledgeGraphQueryEngine(BaseQueryEngine):
         self._storage_context = storage_context
         self.graph_store = storage_context.graph_store
 
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         # Get Graph schema
         self._graph_schema = self.graph_store.get_schema(refresh=refresh_schema)
@@ -96,9 +92,7 @@ class KnowledgeGraphQueryEngine(BaseQueryEngine):
             graph_response_answer_prompt or DEFAULT_KG_RESPONSE_ANSWER_PROMPT
         )
         self._verbose = verbose
-        callback_manager = callback_manager_from_settings_or_context(
-            Settings, service_context
-        )
+        callback_manager = (service_context or Settings).callback_manager
         self._response_synthesizer = response_synthesizer or get_response_synthesizer(
             llm=self._llm,
             callback_manager=callback_manager,
@@ -17,11 +17,7 @@ from llama_index.core.response_synthesizers import (
 )
 from llama_index.core.schema import NodeWithScore, QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 import llama_index.core.instrumentation as instrument
 
 dispatcher = instrument.get_dispatcher(__name__)
@@ -46,11 +42,9 @@ class RetrieverQueryEngine(BaseQueryEngine):
     ) -> None:
         self._retriever = retriever
         self._response_synthesizer = response_synthesizer or get_response_synthesizer(
-            llm=llm_from_settings_or_context(Settings, retriever.get_service_context()),
+            llm=(retriever.get_service_context() or Settings).llm,
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(
-                Settings, retriever.get_service_context()
-            ),
+            or (retriever.get_service_context() or Settings).callback_manager,
         )
 
         self._node_postprocessors = node_postprocessors or []
@@ -105,7 +99,7 @@ class RetrieverQueryEngine(BaseQueryEngine):
                 object.
 
         """
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
 
         response_synthesizer = response_synthesizer or get_response_synthesizer(
             llm=llm,
@@ -120,9 +114,7 @@ class RetrieverQueryEngine(BaseQueryEngine):
             streaming=streaming,
         )
 
-        callback_manager = callback_manager_from_settings_or_context(
-            Settings, service_context
-        )
+        callback_manager = (service_context or Settings).callback_manager
 
         return cls(
             retriever=retriever,
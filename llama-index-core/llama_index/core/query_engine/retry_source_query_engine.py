@@ -13,11 +13,7 @@ from llama_index.core.query_engine.retriever_query_engine import (
 )
 from llama_index.core.schema import Document, QueryBundle
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +34,11 @@ class RetrySourceQueryEngine(BaseQueryEngine):
         """Run a BaseQueryEngine with retries."""
         self._query_engine = query_engine
         self._evaluator = evaluator
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self.max_retries = max_retries
         super().__init__(
             callback_manager=callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
     def _get_prompt_modules(self) -> PromptMixinType:
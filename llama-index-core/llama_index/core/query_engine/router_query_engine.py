@@ -24,11 +24,7 @@ from llama_index.core.response_synthesizers import TreeSummarize
 from llama_index.core.schema import BaseNode, QueryBundle
 from llama_index.core.selectors.utils import get_selector_from_llm
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.tools.query_engine import QueryEngineTool
 from llama_index.core.tools.types import ToolMetadata
 from llama_index.core.utils import print_text
@@ -114,7 +110,7 @@ class RouterQueryEngine(BaseQueryEngine):
         # deprecated
         service_context: Optional[ServiceContext] = None,
     ) -> None:
-        self._llm = llm or llm_from_settings_or_context(Settings, llm)
+        self._llm = llm or (llm or Settings).llm
         self._selector = selector
         self._query_engines = [x.query_engine for x in query_engine_tools]
         self._metadatas = [x.metadata for x in query_engine_tools]
@@ -126,9 +122,7 @@ class RouterQueryEngine(BaseQueryEngine):
         self._verbose = verbose
 
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            )
+            callback_manager=(service_context or Settings).callback_manager
         )
 
     def _get_prompt_modules(self) -> PromptMixinType:
@@ -148,7 +142,7 @@ class RouterQueryEngine(BaseQueryEngine):
         service_context: Optional[ServiceContext] = None,
         **kwargs: Any,
     ) -> "RouterQueryEngine":
-        llm = llm or llm_from_settings_or_context(Settings, llm)
+        llm = llm or (llm or Settings).llm
 
         selector = selector or get_selector_from_llm(llm, is_multi=select_multi)
 
@@ -337,7 +331,7 @@ class ToolRetrieverRouterQueryEngine(BaseQueryEngine):
         service_context: Optional[ServiceContext] = None,
         summarizer: Optional[TreeSummarize] = None,
     ) -> None:
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         self._summarizer = summarizer or TreeSummarize(
             llm=llm,
             summary_template=DEFAULT_TREE_SUMMARIZE_PROMPT_SEL,
@@ -345,7 +339,7 @@ class ToolRetrieverRouterQueryEngine(BaseQueryEngine):
         self._retriever = retriever
 
         super().__init__(
-            callback_manager_from_settings_or_context(Settings, service_context)
+            (service_context or Settings).callback_manager
         )
 
     def _get_prompt_modules(self) -> PromptMixinType:
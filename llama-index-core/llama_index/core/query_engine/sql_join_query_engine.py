@@ -21,7 +21,7 @@ from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import (
     LLMPredictorType,
 )
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.tools.query_engine import QueryEngineTool
 from llama_index.core.utils import print_text
 
@@ -215,7 +215,7 @@ class SQLJoinQueryEngine(BaseQueryEngine):
         self._sql_query_tool = sql_query_tool
         self._other_query_tool = other_query_tool
 
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         self._selector = selector or get_selector_from_llm(self._llm, is_multi=False)
         assert isinstance(self._selector, (LLMSingleSelector, PydanticSingleSelector))
@@ -18,11 +18,7 @@ from llama_index.core.response_synthesizers import (
 )
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.tools.query_engine import QueryEngineTool
 from llama_index.core.utils import get_color_mapping, print_text
 
@@ -97,13 +93,11 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         verbose: bool = True,
         use_async: bool = True,
     ) -> "SubQuestionQueryEngine":
-        callback_manager = callback_manager_from_settings_or_context(
-            Settings, service_context
-        )
+        callback_manager = (service_context or Settings).callback_manager
         if len(query_engine_tools) > 0:
             callback_manager = query_engine_tools[0].query_engine.callback_manager
 
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         if question_gen is None:
             try:
                 from llama_index.question_gen.openai import (
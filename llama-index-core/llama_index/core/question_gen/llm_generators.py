@@ -14,7 +14,7 @@ from llama_index.core.question_gen.types import BaseQuestionGenerator, SubQuesti
 from llama_index.core.schema import QueryBundle
 from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import LLMPredictorType
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.tools.types import ToolMetadata
 from llama_index.core.types import BaseOutputParser
 
@@ -40,7 +40,7 @@ class LLMQuestionGenerator(BaseQuestionGenerator):
         output_parser: Optional[BaseOutputParser] = None,
     ) -> "LLMQuestionGenerator":
         # optionally initialize defaults
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         prompt_template_str = prompt_template_str or DEFAULT_SUB_QUESTION_PROMPT_TMPL
         output_parser = output_parser or SubQuestionOutputParser()
 
@@ -40,11 +40,7 @@ from llama_index.core.schema import (
 )
 from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import LLMPredictorType
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.types import RESPONSE_TEXT_TYPE
 from llama_index.core.instrumentation.events.synthesis import (
     SynthesizeStartEvent,
@@ -81,19 +77,19 @@ class BaseSynthesizer(ChainableMixin, PromptMixin):
         service_context: Optional[ServiceContext] = None,
     ) -> None:
         """Init params."""
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
 
         if callback_manager:
             self._llm.callback_manager = callback_manager
 
         self._callback_manager = (
             callback_manager
-            or callback_manager_from_settings_or_context(Settings, service_context)
+            or (service_context or Settings).callback_manager
         )
 
         self._prompt_helper = (
             prompt_helper
-            or Settings._prompt_helper
+            or Settings.__dict__.get("prompt_helper")
             or PromptHelper.from_llm_metadata(
                 self._llm.metadata,
             )
@@ -27,11 +27,7 @@ from llama_index.core.response_synthesizers.tree_summarize import TreeSummarize
 from llama_index.core.response_synthesizers.type import ResponseMode
 from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import LLMPredictorType
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.types import BasePydanticProgram
 
 
@@ -58,17 +54,17 @@ def get_response_synthesizer(
     simple_template = simple_template or DEFAULT_SIMPLE_INPUT_PROMPT
     summary_template = summary_template or DEFAULT_TREE_SUMMARIZE_PROMPT_SEL
 
-    callback_manager = callback_manager or callback_manager_from_settings_or_context(
-        Settings, service_context
+    callback_manager = (
+        callback_manager or (service_context or Settings).callback_manager
     )
-    llm = llm or llm_from_settings_or_context(Settings, service_context)
+    llm = llm or (service_context or Settings).llm
 
     if service_context is not None:
         prompt_helper = service_context.prompt_helper
     else:
         prompt_helper = (
             prompt_helper
-            or Settings._prompt_helper
+            or Settings.__dict__.get("prompt_helper")
             or PromptHelper.from_llm_metadata(
                 llm.metadata,
             )
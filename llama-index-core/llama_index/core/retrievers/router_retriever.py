@@ -12,11 +12,7 @@ from llama_index.core.prompts.mixin import PromptMixinType
 from llama_index.core.schema import IndexNode, NodeWithScore, QueryBundle
 from llama_index.core.selectors.utils import get_selector_from_llm
 from llama_index.core.service_context import ServiceContext
-from llama_index.core.settings import (
-    Settings,
-    callback_manager_from_settings_or_context,
-    llm_from_settings_or_context,
-)
+from llama_index.core.settings import Settings
 from llama_index.core.tools.retriever_tool import RetrieverTool
 
 logger = logging.getLogger(__name__)
@@ -46,15 +42,13 @@ class RouterRetriever(BaseRetriever):
         object_map: Optional[dict] = None,
         verbose: bool = False,
     ) -> None:
-        self._llm = llm or llm_from_settings_or_context(Settings, service_context)
+        self._llm = llm or (service_context or Settings).llm
         self._selector = selector
         self._retrievers: List[BaseRetriever] = [x.retriever for x in retriever_tools]
         self._metadatas = [x.metadata for x in retriever_tools]
 
         super().__init__(
-            callback_manager=callback_manager_from_settings_or_context(
-                Settings, service_context
-            ),
+            callback_manager=(service_context or Settings).callback_manager,
             object_map=object_map,
             objects=objects,
             verbose=verbose,
@@ -74,7 +68,7 @@ class RouterRetriever(BaseRetriever):
         selector: Optional[BaseSelector] = None,
         select_multi: bool = False,
     ) -> "RouterRetriever":
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         selector = selector or get_selector_from_llm(llm, is_multi=select_multi)
 
         return cls(
@@ -20,7 +20,7 @@ from llama_index.core.service_context import ServiceContext
 from llama_index.core.service_context_elements.llm_predictor import (
     LLMPredictorType,
 )
-from llama_index.core.settings import Settings, llm_from_settings_or_context
+from llama_index.core.settings import Settings
 from llama_index.core.tools.types import ToolMetadata
 from llama_index.core.types import BaseOutputParser
 
@@ -78,7 +78,7 @@ class LLMSingleSelector(BaseSelector):
         output_parser: Optional[BaseOutputParser] = None,
     ) -> "LLMSingleSelector":
         # optionally initialize defaults
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         prompt_template_str = prompt_template_str or DEFAULT_SINGLE_SELECT_PROMPT_TMPL
         output_parser = output_parser or SelectionOutputParser()
 
@@ -172,7 +172,7 @@ class LLMMultiSelector(BaseSelector):
         # deprecated
         service_context: Optional[ServiceContext] = None,
     ) -> "LLMMultiSelector":
-        llm = llm or llm_from_settings_or_context(Settings, service_context)
+        llm = llm or (service_context or Settings).llm
         prompt_template_str = prompt_template_str or DEFAULT_MULTI_SELECT_PROMPT_TMPL
         output_parser = output_parser or SelectionOutputParser()
 
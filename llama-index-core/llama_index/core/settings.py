@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, List, Optional
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence
 
 if TYPE_CHECKING:
     from llama_index.core.service_context import ServiceContext
@@ -7,117 +8,227 @@ if TYPE_CHECKING:
 
 from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.callbacks.base import BaseCallbackHandler, CallbackManager
-from llama_index.core.embeddings.utils import EmbedType, resolve_embed_model
+from llama_index.core.embeddings.utils import resolve_embed_model
 from llama_index.core.indices.prompt_helper import PromptHelper
 from llama_index.core.llms import LLM
-from llama_index.core.llms.utils import LLMType, resolve_llm
+from llama_index.core.llms.utils import resolve_llm
 from llama_index.core.node_parser import NodeParser, SentenceSplitter
 from llama_index.core.schema import TransformComponent
 from llama_index.core.types import PydanticProgramMode
 from llama_index.core.utils import get_tokenizer, set_global_tokenizer
 
+# The top-level `llama_index.core` module cannot be imported at module load
+# (it imports this module); resolve it once on first use instead of running
+# an import statement on every global_handler/tokenizer access.
+_llama_index_core = None
+_set_global_handler: Optional[Callable[..., None]] = None
 
-@dataclass
-class _Settings:
-    """Settings for the Llama Index, lazily initialized."""
 
-    # lazy initialization
-    _llm: Optional[LLM] = None
-    _embed_model: Optional[BaseEmbedding] = None
-    _callback_manager: Optional[CallbackManager] = None
-    _tokenizer: Optional[Callable[[str], List[Any]]] = None
-    _node_parser: Optional[NodeParser] = None
-    _prompt_helper: Optional[PromptHelper] = None
-    _transformations: Optional[List[TransformComponent]] = None
+def _core_module() -> Any:
+    global _llama_index_core
+    if _llama_index_core is None:
+        import llama_index.core
 
-    # ---- LLM ----
+        _llama_index_core = llama_index.core
+    return _llama_index_core
+
+
+# CallbackManager methods mirrored onto the Settings singleton as bound
+# methods whenever the callback manager is (re)bound.
+_CALLBACK_SHORTCUTS = ("on_event_start", "on_event_end", "event")
 
-    @property
-    def llm(self) -> LLM:
-        """Get the LLM."""
-        if self._llm is None:
-            self._llm = resolve_llm("default")
 
-        if self._callback_manager is not None:
-            self._llm.callback_manager = self._callback_manager
+@lru_cache(maxsize=1)
+def _default_llm() -> LLM:
+    """Resolve the default LLM once per process.
 
-        return self._llm
+    Resolution may construct clients and tokenizers, so a second _Settings
+    instance (tests rebuilding the singleton, for example) should reuse the
+    already-initialized model rather than resolving it again.
+    """
+    return resolve_llm("default")
 
-    @llm.setter
-    def llm(self, llm: LLMType) -> None:
-        """Set the LLM."""
-        self._llm = resolve_llm(llm)
+
+@lru_cache(maxsize=1)
+def _default_embed_model() -> BaseEmbedding:
+    """Resolve the default embedding model once per process."""
+    return resolve_embed_model("default")
+
+
+class _Settings:
+    """Settings for the Llama Index, lazily initialized.
+
+    The lazy attributes (``llm``, ``embed_model``, ``callback_manager``,
+    ``node_parser``, ``prompt_helper``, ``transformations``) are
+    ``cached_property`` descriptors: the default is resolved on first access
+    and stored in the instance ``__dict__``, so every subsequent read is a
+    plain attribute load with no descriptor dispatch. ``__setattr__``
+    preserves the resolve-on-assignment semantics of the old property setters
+    (e.g. ``Settings.llm = "default"``) by shadowing the descriptor with the
+    resolved value.
+
+    The class intentionally has no ``__slots__``: ``cached_property`` needs
+    the instance ``__dict__`` to store resolved values, and the dict-shadowed
+    reads it enables are already as cheap as slot access. As a singleton the
+    per-instance memory cost is irrelevant.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _CALLBACK_SHORTCUTS:
+            # materializes the callback manager, which binds the shortcuts
+            self.callback_manager
+            return self.__dict__[name]
+        if name == "text_splitter":
+            # materializes node_parser, which also binds the alias
+            return self.node_parser
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "llm":
+            value = resolve_llm(value)
+            self._attach_callback_manager(value)
+            # the cached program mode and any prompt helper *derived* from
+            # the previous LLM's metadata are stale; drop them so the next
+            # access rebuilds. An explicitly assigned prompt helper is kept.
+            if not self.__dict__.get("_prompt_helper_explicit", False):
+                self.__dict__.pop("prompt_helper", None)
+            self.__dict__.pop("_pydantic_program_mode", None)
+        elif name == "embed_model":
+            value = resolve_embed_model(value)
+            self._attach_callback_manager(value)
+        elif name in ("node_parser", "text_splitter"):
+            # text_splitter is a pure alias; both names stay bound to the
+            # same object in the instance dict so reads are one dict load
+            name = "node_parser"
+            self._attach_callback_manager(value)
+            self.__dict__["text_splitter"] = value
+        elif name == "callback_manager":
+            self._propagate_callback_manager(value)
+        elif name == "prompt_helper":
+            # distinguishes user assignments from the derived default, which
+            # is invalidated when the LLM changes
+            self.__dict__["_prompt_helper_explicit"] = True
+
+        # dispatches to the remaining property setters, otherwise a
+        # plain __dict__ store
+        super().__setattr__(name, value)
+
+    def _attach_callback_manager(self, component: Any) -> None:
+        callback_manager = self.__dict__.get("callback_manager")
+        if callback_manager is not None:
+            component.callback_manager = callback_manager
+
+    def _propagate_callback_manager(self, callback_manager: CallbackManager) -> None:
+        # keep already-materialized components in sync; runs both when the
+        # callback manager is assigned and when the default is materialized
+        for key in ("llm", "embed_model", "node_parser"):
+            component = self.__dict__.get(key)
+            if component is not None:
+                component.callback_manager = callback_manager
+        self._bind_callback_shortcuts(callback_manager)
+
+    def _ensure_initialized(self) -> None:
+        """Materialize every lazy attribute up front.
+
+        After this runs, all settings reads (including the callback
+        shortcuts and the ``text_splitter`` alias) are plain instance-dict
+        loads with no descriptor dispatch — useful for servers that prefer
+        paying resolution cost at startup rather than on the first request.
+        There is no need to freeze or swap the class afterwards:
+        ``cached_property`` is a non-data descriptor, so the materialized
+        values already shadow it.
+        """
+        self.llm
+        self.embed_model
+        self.callback_manager
+        self.node_parser
+        self.prompt_helper
+        self.transformations
+
+    def _bind_callback_shortcuts(self, callback_manager: CallbackManager) -> None:
+        # Bound-method fast paths: hot event code can call
+        # Settings.on_event_start(...) with a single attribute load instead
+        # of the two hops of Settings.callback_manager.on_event_start(...).
+        for name in _CALLBACK_SHORTCUTS:
+            self.__dict__[name] = getattr(callback_manager, name)
+
+    # ---- LLM ----
+
+    @cached_property
+    def llm(self) -> LLM:
+        """The LLM, lazily resolved to the default on first access."""
+        llm = _default_llm()
+        self._attach_callback_manager(llm)
+        return llm
 
     @property
     def pydantic_program_mode(self) -> PydanticProgramMode:
-        """Get the pydantic program mode."""
-        return self.llm.pydantic_program_mode
+        """Get the pydantic program mode.
+
+        Cached on the singleton after the first read so steady-state access
+        skips the hop through the LLM (whose own attribute may be a
+        property); the cache is dropped whenever ``llm`` is reassigned.
+        """
+        try:
+            return self._pydantic_program_mode
+        except AttributeError:
+            mode = self.llm.pydantic_program_mode
+            self.__dict__["_pydantic_program_mode"] = mode
+            return mode
 
     @pydantic_program_mode.setter
     def pydantic_program_mode(self, pydantic_program_mode: PydanticProgramMode) -> None:
         """Set the pydantic program mode."""
+        self.__dict__["_pydantic_program_mode"] = pydantic_program_mode
         self.llm.pydantic_program_mode = pydantic_program_mode
 
     # ---- Embedding ----
 
-    @property
+    @cached_property
     def embed_model(self) -> BaseEmbedding:
-        """Get the embedding model."""
-        if self._embed_model is None:
-            self._embed_model = resolve_embed_model("default")
-
-        if self._callback_manager is not None:
-            self._embed_model.callback_manager = self._callback_manager
-
-        return self._embed_model
-
-    @embed_model.setter
-    def embed_model(self, embed_model: EmbedType) -> None:
-        """Set the embedding model."""
-        self._embed_model = resolve_embed_model(embed_model)
+        """The embedding model, lazily resolved to the default on first access."""
+        embed_model = _default_embed_model()
+        self._attach_callback_manager(embed_model)
+        return embed_model
 
     # ---- Callbacks ----
 
+    @cached_property
+    def callback_manager(self) -> CallbackManager:
+        """The callback manager, lazily constructed on first access."""
+        callback_manager = CallbackManager()
+        self._propagate_callback_manager(callback_manager)
+        return callback_manager
+
     @property
     def global_handler(self) -> Optional[BaseCallbackHandler]:
         """Get the global handler."""
-        import llama_index.core
-
         # TODO: deprecated?
-        return llama_index.core.global_handler
+        return _core_module().global_handler
 
     @global_handler.setter
     def global_handler(self, eval_mode: str, **eval_params: Any) -> None:
         """Set the global handler."""
-        from llama_index.core import set_global_handler
+        global _set_global_handler
+        if _set_global_handler is None:
+            _set_global_handler = _core_module().set_global_handler
 
         # TODO: deprecated?
-        set_global_handler(eval_mode, **eval_params)
-
-    @property
-    def callback_manager(self) -> CallbackManager:
-        """Get the callback manager."""
-        if self._callback_manager is None:
-            self._callback_manager = CallbackManager()
-        return self._callback_manager
-
-    @callback_manager.setter
-    def callback_manager(self, callback_manager: CallbackManager) -> None:
-        """Set the callback manager."""
-        self._callback_manager = callback_manager
+        _set_global_handler(eval_mode, **eval_params)
 
     # ---- Tokenizer ----
 
     @property
     def tokenizer(self) -> Callable[[str], List[Any]]:
         """Get the tokenizer."""
-        import llama_index.core
-
-        if llama_index.core.global_tokenizer is None:
+        global_tokenizer = _core_module().global_tokenizer
+        if global_tokenizer is None:
             return get_tokenizer()
 
         # TODO: deprecated?
-        return llama_index.core.global_tokenizer
+        return global_tokenizer
 
     @tokenizer.setter
     def tokenizer(self, tokenizer: Callable[[str], List[Any]]) -> None:
@@ -137,80 +248,65 @@ class _Settings:
 
     # ---- Node parser ----
 
-    @property
+    @cached_property
     def node_parser(self) -> NodeParser:
-        """Get the node parser."""
-        if self._node_parser is None:
-            self._node_parser = SentenceSplitter()
-
-        if self._callback_manager is not None:
-            self._node_parser.callback_manager = self._callback_manager
-
-        return self._node_parser
+        """The node parser, lazily constructed on first access.
 
-    @node_parser.setter
-    def node_parser(self, node_parser: NodeParser) -> None:
-        """Set the node parser."""
-        self._node_parser = node_parser
+        Also exposed under the ``text_splitter`` alias.
+        """
+        node_parser = SentenceSplitter()
+        self._attach_callback_manager(node_parser)
+        self.__dict__["text_splitter"] = node_parser
+        return node_parser
 
     @property
     def chunk_size(self) -> int:
         """Get the chunk size."""
-        if hasattr(self.node_parser, "chunk_size"):
-            return self.node_parser.chunk_size
-        else:
+        node_parser = self.node_parser
+        try:
+            return node_parser.chunk_size
+        except AttributeError:
             raise ValueError("Configured node parser does not have chunk size.")
 
     @chunk_size.setter
     def chunk_size(self, chunk_size: int) -> None:
         """Set the chunk size."""
-        if hasattr(self.node_parser, "chunk_size"):
-            self.node_parser.chunk_size = chunk_size
-        else:
+        node_parser = self.node_parser
+        if not hasattr(node_parser, "chunk_size"):
             raise ValueError("Configured node parser does not have chunk size.")
+        node_parser.chunk_size = chunk_size
 
     @property
     def chunk_overlap(self) -> int:
         """Get the chunk overlap."""
-        if hasattr(self.node_parser, "chunk_overlap"):
-            return self.node_parser.chunk_overlap
-        else:
+        node_parser = self.node_parser
+        try:
+            return node_parser.chunk_overlap
+        except AttributeError:
             raise ValueError("Configured node parser does not have chunk overlap.")
 
     @chunk_overlap.setter
     def chunk_overlap(self, chunk_overlap: int) -> None:
         """Set the chunk overlap."""
-        if hasattr(self.node_parser, "chunk_overlap"):
-            self.node_parser.chunk_overlap = chunk_overlap
-        else:
+        node_parser = self.node_parser
+        if not hasattr(node_parser, "chunk_overlap"):
             raise ValueError("Configured node parser does not have chunk overlap.")
+        node_parser.chunk_overlap = chunk_overlap
 
-    # ---- Node parser alias ----
-
-    @property
-    def text_splitter(self) -> NodeParser:
-        """Get the text splitter."""
-        return self.node_parser
-
-    @text_splitter.setter
-    def text_splitter(self, text_splitter: NodeParser) -> None:
-        """Set the text splitter."""
-        self.node_parser = text_splitter
+    # ---- Prompt helper ----
 
-    @property
+    @cached_property
     def prompt_helper(self) -> PromptHelper:
-        """Get the prompt helper."""
-        if self._llm is not None and self._prompt_helper is None:
-            self._prompt_helper = PromptHelper.from_llm_metadata(self._llm.metadata)
-        elif self._prompt_helper is None:
-            self._prompt_helper = PromptHelper()
+        """The prompt helper, derived from the LLM metadata when one is set.
 
-        return self._prompt_helper
-
-    @prompt_helper.setter
-    def prompt_helper(self, prompt_helper: PromptHelper) -> None:
-        """Set the prompt helper."""
-        self._prompt_helper = prompt_helper
+        Rebuilt on the next access after ``llm`` is reassigned, and
+        ``llm.metadata`` (a property that may do real work on some LLMs) is
+        read exactly once per build.
+        """
+        llm = self.__dict__.get("llm")
+        if llm is not None:
+            return PromptHelper.from_llm_metadata(llm.metadata)
+        return PromptHelper()
 
     @property
     def num_output(self) -> int:
@@ -234,17 +330,15 @@ class _Settings:
 
     # ---- Transformations ----
 
-    @property
-    def transformations(self) -> List[TransformComponent]:
-        """Get the transformations."""
-        if self._transformations is None:
-            self._transformations = [self.node_parser]
-        return self._transformations
+    @cached_property
+    def transformations(self) -> Sequence[TransformComponent]:
+        """The transformations, defaulting to the node parser.
 
-    @transformations.setter
-    def transformations(self, transformations: List[TransformComponent]) -> None:
-        """Set the transformations."""
-        self._transformations = transformations
+        The default is a tuple: mutating it in place would silently change
+        global settings state, so callers wanting to customize the pipeline
+        should assign a fresh list instead.
+        """
+        return (self.node_parser,)
 
 
 # Singleton
@@ -254,51 +348,36 @@ Settings = _Settings()
 # -- Helper functions for deprecation/migration --
 
 
-def llm_from_settings_or_context(
-    settings: _Settings, context: Optional["ServiceContext"]
-) -> LLM:
-    """Get settings from either settings or context."""
-    if context is not None:
-        return context.llm
-
-    return settings.llm
-
-
-def embed_model_from_settings_or_context(
-    settings: _Settings, context: Optional["ServiceContext"]
-) -> BaseEmbedding:
-    """Get settings from either settings or context."""
-    if context is not None:
-        return context.embed_model
-
-    return settings.embed_model
-
-
-def callback_manager_from_settings_or_context(
-    settings: _Settings, context: Optional["ServiceContext"]
-) -> CallbackManager:
-    """Get settings from either settings or context."""
-    if context is not None:
-        return context.callback_manager
-
-    return settings.callback_manager
+def _from_settings_or_context(
+    attr: str,
+) -> Callable[[_Settings, Optional["ServiceContext"]], Any]:
+    """Build a settings-or-context accessor for a single attribute.
 
+    The per-attribute helpers below were six copies of the same two-line
+    function; binding a C-level attrgetter in a closure keeps the public
+    names while sharing one implementation.
 
-def node_parser_from_settings_or_context(
-    settings: _Settings, context: Optional["ServiceContext"]
-) -> NodeParser:
-    """Get settings from either settings or context."""
-    if context is not None:
-        return context.node_parser
+    Deprecated: new code should inline ``(context or Settings).<attr>``
+    instead of going through these wrappers; they are kept as shims for
+    backwards compatibility.
+    """
+    get = attrgetter(attr)
 
-    return settings.node_parser
+    def from_settings_or_context(
+        settings: _Settings, context: Optional["ServiceContext"]
+    ) -> Any:
+        """Get settings from either settings or context."""
+        return get(settings) if context is None else get(context)
 
+    from_settings_or_context.__name__ = f"{attr}_from_settings_or_context"
+    from_settings_or_context.__qualname__ = from_settings_or_context.__name__
+    return from_settings_or_context
 
-def transformations_from_settings_or_context(
-    settings: _Settings, context: Optional["ServiceContext"]
-) -> List[TransformComponent]:
-    """Get settings from either settings or context."""
-    if context is not None:
-        return context.transformations
 
-    return settings.transformations
+llm_from_settings_or_context = _from_settings_or_context("llm")
+embed_model_from_settings_or_context = _from_settings_or_context("embed_model")
+callback_manager_from_settings_or_context = _from_settings_or_context(
+    "callback_manager"
+)
+node_parser_from_settings_or_context = _from_settings_or_context("node_parser")
+transformations_from_settings_or_context = _from_settings_or_context("transformations")
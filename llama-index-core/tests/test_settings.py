@@ -0,0 +1,151 @@
+import pytest
+from llama_index.core.callbacks.base import CallbackManager
+from llama_index.core.indices.prompt_helper import PromptHelper
+from llama_index.core.llms.mock import MockLLM
+from llama_index.core.node_parser import MarkdownNodeParser, TokenTextSplitter
+from llama_index.core.settings import _Settings
+from llama_index.core.types import PydanticProgramMode
+
+
+@pytest.fixture()
+def settings() -> _Settings:
+    return _Settings()
+
+
+def test_llm_assignment_is_resolved(settings: _Settings) -> None:
+    llm = MockLLM()
+    settings.llm = llm
+    assert settings.llm is llm
+
+
+def test_callback_manager_propagates_to_materialized_components(
+    settings: _Settings,
+) -> None:
+    settings.llm = MockLLM()
+    settings.node_parser = TokenTextSplitter(tokenizer=str.split)
+
+    callback_manager = CallbackManager()
+    settings.callback_manager = callback_manager
+
+    assert settings.llm.callback_manager is callback_manager
+    assert settings.node_parser.callback_manager is callback_manager
+
+
+def test_callback_manager_attaches_to_later_components(settings: _Settings) -> None:
+    callback_manager = CallbackManager()
+    settings.callback_manager = callback_manager
+    settings.llm = MockLLM()
+    assert settings.llm.callback_manager is callback_manager
+
+
+def test_lazy_callback_manager_attaches_to_existing_components(
+    settings: _Settings,
+) -> None:
+    settings.llm = MockLLM()
+    # materialize the default via the getter, not assignment
+    callback_manager = settings.callback_manager
+    assert settings.llm.callback_manager is callback_manager
+
+
+def test_callback_shortcuts_follow_callback_manager(settings: _Settings) -> None:
+    assert settings.on_event_start.__self__ is settings.callback_manager
+
+    callback_manager = CallbackManager()
+    settings.callback_manager = callback_manager
+    assert settings.on_event_start.__self__ is callback_manager
+    assert settings.on_event_end.__self__ is callback_manager
+    assert settings.event.__self__ is callback_manager
+
+
+def test_text_splitter_aliases_node_parser(settings: _Settings) -> None:
+    node_parser = TokenTextSplitter(tokenizer=str.split)
+    settings.text_splitter = node_parser
+    assert settings.node_parser is node_parser
+
+    other = TokenTextSplitter(tokenizer=str.split)
+    settings.node_parser = other
+    assert settings.text_splitter is other
+
+
+def test_chunk_size_and_overlap_accessors(settings: _Settings) -> None:
+    settings.node_parser = TokenTextSplitter(
+        tokenizer=str.split, chunk_size=512, chunk_overlap=10
+    )
+    assert settings.chunk_size == 512
+    assert settings.chunk_overlap == 10
+
+    settings.chunk_size = 256
+    settings.chunk_overlap = 5
+    assert settings.node_parser.chunk_size == 256
+    assert settings.node_parser.chunk_overlap == 5
+
+
+def test_chunk_size_requires_chunking_parser(settings: _Settings) -> None:
+    settings.node_parser = MarkdownNodeParser()
+    with pytest.raises(ValueError):
+        settings.chunk_size
+    with pytest.raises(ValueError):
+        settings.chunk_size = 512
+    with pytest.raises(ValueError):
+        settings.chunk_overlap
+    with pytest.raises(ValueError):
+        settings.chunk_overlap = 10
+
+
+def test_transformations_default_is_immutable(settings: _Settings) -> None:
+    node_parser = TokenTextSplitter(tokenizer=str.split)
+    settings.node_parser = node_parser
+
+    assert settings.transformations == (node_parser,)
+    with pytest.raises(AttributeError):
+        settings.transformations.append(node_parser)  # type: ignore[attr-defined]
+
+    # explicit assignment still takes any sequence
+    settings.transformations = [node_parser]
+    assert settings.transformations == [node_parser]
+
+
+@pytest.fixture()
+def mock_tokenizer(monkeypatch: pytest.MonkeyPatch) -> None:
+    # PromptHelper falls back to tiktoken, which downloads its encoding
+    monkeypatch.setattr("llama_index.core.global_tokenizer", str.split, raising=False)
+
+
+def test_prompt_helper_derived_from_llm(
+    settings: _Settings, mock_tokenizer: None
+) -> None:
+    settings.llm = MockLLM()
+    assert (
+        settings.prompt_helper.context_window == settings.llm.metadata.context_window
+    )
+
+
+def test_prompt_helper_rebuilt_on_llm_change(
+    settings: _Settings, mock_tokenizer: None
+) -> None:
+    settings.llm = MockLLM()
+    derived = settings.prompt_helper
+    settings.llm = MockLLM(max_tokens=16)
+    assert settings.prompt_helper is not derived
+
+
+def test_explicit_prompt_helper_survives_llm_change(
+    settings: _Settings, mock_tokenizer: None
+) -> None:
+    prompt_helper = PromptHelper()
+    settings.prompt_helper = prompt_helper
+    settings.llm = MockLLM()
+    assert settings.prompt_helper is prompt_helper
+
+
+def test_pydantic_program_mode_syncs_with_llm(settings: _Settings) -> None:
+    settings.llm = MockLLM()
+    assert settings.pydantic_program_mode == PydanticProgramMode.DEFAULT
+
+    settings.pydantic_program_mode = PydanticProgramMode.LLM
+    assert settings.llm.pydantic_program_mode == PydanticProgramMode.LLM
+    assert settings.pydantic_program_mode == PydanticProgramMode.LLM
+
+    # a newly assigned LLM brings its own mode
+    settings.llm = MockLLM()
+    assert settings.pydantic_program_mode == PydanticProgramMode.DEFAULT